@@ -18,5 +18,6 @@ setup(
     ],
     keywords='smarthub electric',
     python_requires='>=3.10',
+    install_requires=['numpy'],
 )
 
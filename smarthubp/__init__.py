@@ -1,3 +1,4 @@
 from .meter_reading import MeterReading
+from .reading_series import ReadingSeries
 from .reading_service import ReadingService, readings_from_file, readings_from_str
 from .time_utils import set_import_time_offset
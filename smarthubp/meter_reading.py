@@ -2,8 +2,13 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class MeterReading:
-    """ Contains information related to a meter reading. """
+    """ Contains information related to a meter reading.
+
+        Instances are created in bulk by the parsing hot paths, so slots are used to drop the
+        per-instance __dict__ and keep the per-reading footprint small.  Kept mutable so
+        apply_subtractive_meter can adjust kwh in place.
+    """
     timestamp: datetime
     kwh: float
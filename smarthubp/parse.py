@@ -1,11 +1,33 @@
 import logging
-from datetime import timedelta
+import re
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
 
 from smarthubp.meter_reading import MeterReading
-from smarthubp.time_utils import timestamp_from_encoded, time_offset
+from smarthubp.time_utils import timestamp_from_encoded, epochs_from_encoded, time_offset
 
 UNEXPECTED_EXIT_COMBINED_LIST = "Unexpected exit from combined list processing."
 
+# Sentinel tokens delimiting entries in the combined list and the per-meter lists.
+# Tuples rather than sets so they can feed np.isin directly.
+_COMBINED_SENTINELS = ('9', '11')
+_LIST_SENTINELS = ('8', '24', '3')
+
+# Separator tokens worth interning after the split: str.split returns a fresh string object
+# for every occurrence, so interning lets the hot-path comparisons hit the pointer-equality
+# fast path instead of comparing characters.
+_INTERN_TOKENS = frozenset(_COMBINED_SENTINELS + _LIST_SENTINELS + ('10',))
+
+# Classifies a metadata token in a single pass.  Group order encodes precedence: a token with a '.'
+# is a class name even if it also contains '#' or '-', and a color beats a dashed name.  Anything
+# that matches none of the marker characters falls through to the meter group.
+_CLASSIFY = re.compile(r'(?P<classname>.*\..*)|(?P<color>.*#.*)|(?P<dashed>.*-.*)|(?P<meter>.*)')
+
+# Matches every javascript concat seam ([].concat([], [], ...), possibly nested) in one pass.
+_CONCAT_RE = re.compile(r'\]\)?\.concat\(\[|\],\[')
+
 
 def _read_combined(csvd: list[str]) -> list[MeterReading]:
     """ Read the combined list, a list near the end of the dataset which contains values from all other lists
@@ -24,14 +46,21 @@ def _read_combined(csvd: list[str]) -> list[MeterReading]:
     # in _read_list refers to this list.
     # The number '11' should immediately follow the list.
 
-    idx = len(csvd)-1
-
-    ret = []
-    while idx >= 0:
-        while idx >= 0 and csvd[idx] != '9' and csvd[idx] != '11': idx -= 1
-
+    # Locate every '9'/'11' sentinel in one vectorized pass rather than walking the list
+    # token by token in the interpreter, then visit only those candidates back to front.
+    arr = np.array(csvd, dtype=object)
+    hits = np.flatnonzero(np.isin(arr, _COMBINED_SENTINELS))[::-1]
+
+    # Preallocate for the upper bound (one entry per sentinel hit) and fill from the end, so
+    # the tokens land already in meter idx order and neither list is resized or reversed.
+    # The timestamps will be opposite the other meters.
+    n = len(hits)
+    kwh_tokens = [None] * n
+    ts_tokens = [None] * n
+    count = 0
+    for idx in hits:
         # Processing outside the list which has repeated 8, 9, 10 patterns.  Exit processing.
-        if idx < 0 or csvd[idx-2] != '10':
+        if csvd[idx-2] != '10':
             logging.warning(UNEXPECTED_EXIT_COMBINED_LIST)
             break
 
@@ -39,17 +68,62 @@ def _read_combined(csvd: list[str]) -> list[MeterReading]:
         if csvd[idx] == '11':
             break
 
-        ts = timestamp_from_encoded(csvd[idx - 1])
-        ret.append(MeterReading(ts, float(csvd[idx-3])))
-        idx -= 1
-    # Must be reversed to correspond to meter idx values.  The timestamps will be opposite the other meters.
-    ret.reverse()
-    return ret
+        pos = n - 1 - count
+        kwh_tokens[pos] = csvd[idx-3]
+        ts_tokens[pos] = csvd[idx-1]
+        count += 1
+    else:
+        # Ran out of sentinels without ever finding the end of the list.
+        logging.warning(UNEXPECTED_EXIT_COMBINED_LIST)
+
+    # Trim the slots left unfilled by an early exit.
+    if count != n:
+        del kwh_tokens[:n - count]
+        del ts_tokens[:n - count]
+
+    # Decode all the gathered timestamps in one batched call rather than per reading.
+    epochs = epochs_from_encoded(ts_tokens)
+    return [MeterReading(datetime.fromtimestamp(int(sec)), float(kwh))
+            for kwh, sec in zip(kwh_tokens, epochs)]
+
+
+def _sentinel_positions(csvd: list[str]) -> np.ndarray:
+    """ Locate every list sentinel ('8', '24', '3') in csvd with one vectorized pass.
+
+        Args:
+            csvd (list): The comma separated value list.
+        Returns:
+            np.ndarray: The sentinel indices, sorted ascending.
+    """
+    arr = np.array(csvd, dtype=object)
+    return np.flatnonzero(np.isin(arr, _LIST_SENTINELS))
+
+
+def _combined_ref_map(combined_readings: list[MeterReading]) -> dict[int, MeterReading]:
+    """ Map each raw file index token value to its combined-list reading.
+
+        Index tokens encode the combined-list position as roughly (-i * 3) - 7, counted from
+        the end of the list; timestamp and reading references to the same entry differ by one.
+        All three token values that floor-divide to an entry are mapped, so the per-reading
+        divide-and-offset arithmetic becomes a single dict probe.
+
+        Args:
+            combined_readings (list): The combined readings list from _read_combined.
+        Returns:
+            dict[int, MeterReading]: File index token value to reading.
+    """
+    ref_map = {}
+    for i, reading in enumerate(reversed(combined_readings)):
+        token = (-i * 3) - 7
+        ref_map[token] = ref_map[token - 1] = ref_map[token - 2] = reading
+    return ref_map
 
 
 def _get_list_readings(csvd: list[str],
                        idx: int,
-                       combined_readings: list[MeterReading]) -> tuple[int, list[MeterReading]]:
+                       combined_readings: list[MeterReading],
+                       sentinel_positions: np.ndarray | None = None,
+                       ref_map: dict[int, MeterReading] | None = None) -> tuple[int, list[MeterReading]]:
     """
     Given the comma-separated value list (csvd) and a starting index (idx),
     retrieve the timestamps and readings for the next list. Return the stop index and
@@ -61,6 +135,11 @@ def _get_list_readings(csvd: list[str],
         combined_readings (list): The list of combined readings to be provided. This list should
             be generated using the `_read_combined` method to ensure the expected format.  This list is used
             when a reading is referenced by index.
+        sentinel_positions (np.ndarray): The precomputed output of _sentinel_positions for csvd.
+            Computed on demand when omitted; callers processing several lists should compute it
+            once and pass it in.
+        ref_map (dict): The precomputed output of _combined_ref_map for combined_readings.
+            Computed on demand when omitted, as with sentinel_positions.
 
     Returns:
         tuple: A tuple containing the stop index and MeterReadings.
@@ -73,29 +152,44 @@ def _get_list_readings(csvd: list[str],
     # f.ff, 10, -1207, 0, 0, 1, 0, 0, 8
     # When an index is present instead of an reading or timestamp it is an index into the combined list, which must
     # be separately read and provided to this function.
+    if sentinel_positions is None:
+        sentinel_positions = _sentinel_positions(csvd)
+    if ref_map is None:
+        ref_map = _combined_ref_map(combined_readings)
+
+    # One timedelta for the whole list instead of one allocation per reading.
+    offset_td = timedelta(hours=time_offset)
+
     readings = []
+    # Bind the hot names to locals: the loop then pays LOAD_FAST for them instead of a
+    # global or attribute lookup per reading.
+    append = readings.append
+    searchsorted = np.searchsorted
+    from_encoded = timestamp_from_encoded
+    reading_cls = MeterReading
     while idx >= 0:
-        while idx >= 0 and csvd[idx] not in ['8', '24', '3']: idx -= 1
+        # Jump straight to the nearest sentinel at or below idx instead of stepping one
+        # token at a time through the interpreter.
+        pos = searchsorted(sentinel_positions, idx, side='right') - 1
+        idx = int(sentinel_positions[pos]) if pos >= 0 else -1
         if idx < 8 or csvd[idx] != '8': break
         idx -= 6
 
         ts = None
         if csvd[idx] == '9':
-            ts = timestamp_from_encoded(csvd[idx - 1])
+            ts = from_encoded(csvd[idx - 1])
             idx -= 2
         else:  # index into combined list instead of giving a timestamp
-            j = (int(csvd[idx]) // 3) + 2
-            ts = combined_readings[j].timestamp
+            ts = ref_map[int(csvd[idx])].timestamp
             idx -= 1
-        ts += timedelta(hours=time_offset)
+        ts += offset_td
 
         kwh = None
         if csvd[idx] == '10':
             kwh = float(csvd[idx-1])
         else:  # index into combined list instead of giving a reading
-            j = (int(csvd[idx]) // 3) + 2
-            kwh = combined_readings[j].kwh
-        readings.append(MeterReading(ts, kwh))
+            kwh = ref_map[int(csvd[idx])].kwh
+        append(reading_cls(ts, kwh))
     return idx, readings
 
 
@@ -111,8 +205,14 @@ def meter_reading_generator(csvd: list[str], combined_readings: list[MeterReadin
             list[MeterReading]: The next reading list in the comma-separated value list.
     """
 
-    idx = len(csvd)-1
-    while idx >= 0 and csvd[idx] != '24': idx -= 1
+    arr = np.array(csvd, dtype=object)
+    sentinel_positions = np.flatnonzero(np.isin(arr, _LIST_SENTINELS))
+    ref_map = _combined_ref_map(combined_readings)
+
+    # Jump straight to the last list marker; the Python scan previously walked the whole
+    # combined list one token at a time to find it.
+    starts = np.flatnonzero(arr == '24')
+    idx = int(starts[-1]) if len(starts) else -1
 
     while idx >= 0:
         if csvd[idx] == '3': break
@@ -122,18 +222,18 @@ def meter_reading_generator(csvd: list[str], combined_readings: list[MeterReadin
         # Really should read the time offset off of the second timestamp.
         # Find the beginning of list data.
         while csvd[idx] != '8': idx -= 1
-        idx, reading_list = _get_list_readings(csvd, idx, combined_readings)
+        idx, reading_list = _get_list_readings(csvd, idx, combined_readings, sentinel_positions, ref_map)
         yield reading_list
 
 
-def _extract_meters(meta_csv: list[str]) -> list[str]:
-    """ Returns a list of meters given the metadata list.
+def _extract_meters(meta_str: str) -> list[str]:
+    """ Returns a list of meters given the metadata string.
         Args:
-            meta_csv (list): The metadata list, extracted from the primary comma-separated values.
+            meta_str (str): The metadata section of the primary comma-separated values, unsplit.
         Returns:
             list[str]: The meter names present in this data set.
         Raises:
-            InvalidMetadata: If the metadata list does cannot be processed due to lack of expected markers.
+            InvalidMetadata: If the metadata cannot be processed due to lack of expected markers.
     """
     # The second list contains an array of class names and account information.
     # The meters correspond, in reverse order, to the kwh lists above.
@@ -144,41 +244,55 @@ def _extract_meters(meta_csv: list[str]) -> list[str]:
     #    a value with a - in it is either a net meter name or not a meter. (gray-stroke for example)
     # all values between the first + and the "column" label that aren't
     # a color, class name, or contain a -, are meters.
-    indices = [i for i, n in enumerate(meta_csv) if "+" in n]
-    if not indices:
-        raise InvalidMetadata("The provided meta-data values lack any appropriate start marker.")
-
-    # The meter portion ends with a "net-meter", "column", type structure.
-    try:
-        indices.append(meta_csv.index('"column"'))
-    except ValueError:
-        raise InvalidMetadata("The provided meta-data values lacks the appropriate end marker.")
-
+    # Tokens are walked in place via finditer rather than materializing a split list.
     ret = []
-
-    for start, end in zip(indices, indices[1:]):
-        # Strip off the first and last characters to eliminate quotation marks.
-        meter_name = meta_csv[start+1][1:-1]
-        submeter_names = []
-        for v in meta_csv[start+2:end]:
-            # Assume that none of these characters can be in meter names.
-            if '.' in v: continue  # class name
-            if '#' in v: continue  # color name, url(#anchor)
-            v = v[1:-1]  # Strip off first and last characters to eliminate quotation marks.
-            if meter_name in v:  # submeter (meter_name - Consumption, for example)
-                submeter_names.append(v)
-            elif '-' in v: continue
-            else:
-                if submeter_names:
-                    ret += submeter_names
-                    submeter_names = []
-                else:
-                    ret.append(meter_name)
-                meter_name = v
-
-        if submeter_names: ret += submeter_names
-        else: ret.append(meter_name)
-    return ret
+    meter_name = None
+    submeter_names = []
+    seen_start = False
+    expect_name = False
+
+    def flush():
+        nonlocal submeter_names
+        if submeter_names:
+            ret.extend(submeter_names)
+            submeter_names = []
+        elif meter_name is not None:
+            ret.append(meter_name)
+
+    for match in re.finditer(r'[^,]+', meta_str):
+        v = match.group()
+        # The meter portion ends with a "net-meter", "column", type structure.
+        if v == '"column"':
+            if not seen_start:
+                raise InvalidMetadata("The provided meta-data values lack any appropriate start marker.")
+            flush()
+            return ret
+        if '+' in v:
+            if seen_start: flush()
+            seen_start = True
+            expect_name = True
+            continue
+        if not seen_start: continue
+        if expect_name:
+            # Strip off the first and last characters to eliminate quotation marks.
+            meter_name = v[1:-1]
+            expect_name = False
+            continue
+        # Assume that none of the marker characters can be in meter names.
+        kind = _CLASSIFY.match(v).lastgroup
+        if kind == 'classname': continue
+        if kind == 'color': continue  # color name, url(#anchor)
+        v = v[1:-1]  # Strip off first and last characters to eliminate quotation marks.
+        if meter_name in v:  # submeter (meter_name - Consumption, for example)
+            submeter_names.append(v)
+        elif kind == 'dashed': continue
+        else:
+            flush()
+            meter_name = v
+
+    if not seen_start:
+        raise InvalidMetadata("The provided meta-data values lack any appropriate start marker.")
+    raise InvalidMetadata("The provided meta-data values lacks the appropriate end marker.")
 
 
 def _transform_data_to_list(data: str) -> tuple[list[str], list[str]]:
@@ -197,10 +311,12 @@ def _transform_data_to_list(data: str) -> tuple[list[str], list[str]]:
     """
     if data[0:5] != "//OK[": raise InvalidData("Input does not start with //OK and a list open.")
     data = data.strip()
-    data = data.replace('].concat([', ',')  # long arrays get javascript concats inside.  Fun!
-    data = data.replace(']).concat([', ',')  # In case we get a concat of a concat?  Haven't actually seen this.
-    data = data.replace('],[', ',')    # concat seems to do a list of lists... like [].concat([], [], [], ...)
-    data = data.rstrip(')')            # Finally remove the closing paren of the concat function, if present.
+    # long arrays get javascript concats inside ([].concat([], [], ...)), possibly nested.  Fun!
+    # Collapse all the concat seams in one pass; a payload without them (the common case) is
+    # left untouched rather than copied three times over.
+    if '.concat(' in data or '],[' in data:
+        data = _CONCAT_RE.sub(',', data)
+        data = data.rstrip(')')  # Finally remove the closing paren of the concat function, if present.
 
     if data[-1] != ']': raise InvalidData("Input does not close with list termination.")
 
@@ -209,11 +325,12 @@ def _transform_data_to_list(data: str) -> tuple[list[str], list[str]]:
     if metadata_start == 4: raise InvalidMetadata("No metadata found within input.")
 
     # raises InvalidMetadata
-    meter_names: list[str] = _extract_meters(data[metadata_start:-4].split(','))
+    meter_names: list[str] = _extract_meters(data[metadata_start:-4])
     meter_names.reverse()
     logging.debug(f'Found {meter_names=}.')
 
     csvd = data[5:metadata_start].split(',')  # Drop header, metadata, and footer.
+    csvd = [sys.intern(token) if token in _INTERN_TOKENS else token for token in csvd]
 
     return meter_names, csvd
 
@@ -0,0 +1,110 @@
+from datetime import datetime
+
+import numpy as np
+
+
+class ReadingView:
+    """ A MeterReading-compatible view of one row of a ReadingSeries.
+
+        The datetime timestamp is only materialized when the attribute is read; comparisons and
+        arithmetic on the backing int64 column never pay for datetime construction.  kwh reads
+        and writes go straight to the backing array, so mutating a view mutates the series.
+    """
+    __slots__ = ('_series', '_idx')
+
+    def __init__(self, series: "ReadingSeries", idx: int):
+        self._series = series
+        self._idx = idx
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(int(self._series.ts[self._idx]))
+
+    @property
+    def kwh(self) -> float:
+        return float(self._series.kwh[self._idx])
+
+    @kwh.setter
+    def kwh(self, value: float):
+        self._series.kwh[self._idx] = value
+
+
+class ReadingSeries:
+    """ Struct-of-arrays storage for a series of meter readings.
+
+        Timestamps are held as int64 epoch seconds and readings as float64 kwh in two parallel
+        NumPy arrays.  Consumers that only need one column (reading lists, timestamp lists,
+        timestamp alignment) can operate on the arrays directly with vectorized calls instead of
+        touching one reading object per row.  Indexing and iteration produce ReadingView
+        objects, so the class can stand in for a list[MeterReading] while deferring datetime
+        construction until a timestamp is actually read.
+    """
+
+    def __init__(self, ts: np.ndarray, kwh: np.ndarray):
+        """Initializes a new instance of ReadingSeries.
+
+        The stored timestamps are always ascending: the searchsorted alignment in report()
+        and apply_subtractive_meter() depends on it, and the meter lists parsed from a
+        reading-service payload arrive in the opposite order to the combined list.  Input
+        that is already ascending is stored as-is.
+
+        Args:
+            ts (np.ndarray): Timestamps as epoch seconds, in timestamp order (either
+                direction).
+            kwh (np.ndarray): Readings in kwh, parallel to ts.
+        """
+        self.ts: np.ndarray = np.asarray(ts, dtype=np.int64)
+        self.kwh: np.ndarray = np.asarray(kwh, dtype=np.float64)
+        if len(self.ts) > 1 and not (self.ts[1:] >= self.ts[:-1]).all():
+            order = np.argsort(self.ts, kind='stable')
+            self.ts = self.ts[order]
+            self.kwh = self.kwh[order]
+
+    @classmethod
+    def from_readings(cls, readings) -> "ReadingSeries":
+        """Builds a ReadingSeries from an iterable of MeterReading values.
+
+        Args:
+            readings: MeterReading values, in timestamp order (either direction).
+
+        Returns:
+            ReadingSeries: The equivalent struct-of-arrays series, ascending.
+        """
+        readings = list(readings)
+        ts = np.fromiter((int(r.timestamp.timestamp()) for r in readings),
+                         dtype=np.int64, count=len(readings))
+        kwh = np.fromiter((r.kwh for r in readings), dtype=np.float64, count=len(readings))
+        return cls(ts, kwh)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def __getitem__(self, idx: int) -> ReadingView:
+        """Returns a view of the reading at idx.
+
+        Args:
+            idx (int): The row to retrieve.
+
+        Returns:
+            ReadingView: The reading at idx.
+        """
+        return ReadingView(self, idx)
+
+    def __iter__(self):
+        for idx in range(len(self.ts)):
+            yield ReadingView(self, idx)
+
+
+def as_series(readings) -> ReadingSeries:
+    """Coerces a list of MeterReading values to a ReadingSeries; passes a ReadingSeries through.
+
+    Args:
+        readings: A ReadingSeries or a list of MeterReading values in timestamp order
+            (either direction).
+
+    Returns:
+        ReadingSeries: The readings in struct-of-arrays form, ascending.
+    """
+    if isinstance(readings, ReadingSeries):
+        return readings
+    return ReadingSeries.from_readings(readings)
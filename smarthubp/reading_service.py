@@ -18,10 +18,13 @@
  """
 import logging
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
+
+import numpy as np
 
 from smarthubp.meter_reading import MeterReading
 from smarthubp.parse import _read_combined, meter_reading_generator, _transform_data_to_list
+from smarthubp.reading_series import ReadingSeries, as_series
 from smarthubp.time_utils import time_offset
 from smarthubp.parse import InvalidData
 
@@ -37,7 +40,10 @@ def readings_from_file(fname: str):
             InvalidData : If the data format isn't recognized.
             InvalidMetaData : If the metadata format isn't recognized.
     """
-    return readings_from_str(open(fname).readlines()[0])
+    # The payload is the first (usually only) line; readline avoids materializing a list of
+    # every line, and the context manager closes the handle rather than leaking it.
+    with open(fname, 'r', encoding='utf-8') as hndl:
+        return readings_from_str(hndl.readline())
 
 
 def readings_from_str(data: str) -> "ReadingService":
@@ -102,39 +108,56 @@ def readings_from_utility_usage(jsd: dict):
                          valid source.
     """
     base_data = jsd['data']['ELECTRIC'][0]
-    combined_readings = [MeterReading(datetime.fromtimestamp((v["x"]//1000)+21600), v["y"])
-                         for v in base_data["baseSeries"]["data"]]
-    reading_lists = {}
-    for series in base_data["series"]:
-        meter = series['name']
-        readings = [MeterReading(datetime.fromtimestamp((v["x"]//1000)+21600), v["y"]) for v in series['data']]
-        reading_lists[meter] = readings
+    combined_readings = _series_from_points(base_data["baseSeries"]["data"])
+    reading_lists = {series['name']: _series_from_points(series['data'])
+                     for series in base_data["series"]}
     return ReadingService(combined_readings, reading_lists)
 
 
+def _series_from_points(points: list[dict]) -> ReadingSeries:
+    """ Build a ReadingSeries directly from utility-usage {x: msec, y: kwh} points.
+
+        Args:
+            points (list[dict]): The data list of one series from the utility-usage response.
+        Returns:
+            ReadingSeries: Timestamps and readings in struct-of-arrays form.
+    """
+    ts = np.fromiter(((v["x"] // 1000) + 21600 for v in points), dtype=np.int64, count=len(points))
+    kwh = np.fromiter((v["y"] for v in points), dtype=np.float64, count=len(points))
+    return ReadingSeries(ts, kwh)
+
+
 class ReadingService:
     """ Class exposes data from the Smarthub's ReadingService RPC response and provides related utility functions.
 
         Instantiate this class via the readings_from_str or readings_from_file factory methods.
     """
-    def __init__(self, combined: list[MeterReading], meters: dict[str, list[MeterReading]]):
+    def __init__(self,
+                 combined: list[MeterReading] | ReadingSeries,
+                 meters: dict[str, list[MeterReading] | ReadingSeries]):
         """Initializes a new instance of ReadingService.
 
+        Readings are stored internally as ReadingSeries, so timestamps stay int64 epoch
+        seconds until a caller actually reads one; lists of MeterReading are converted on
+        the way in.
+
         Args:
-            combined (list[MeterReading]): A list of combined meter readings.
-            meters (dict[str, list[MeterReading]]): A dictionary mapping meter names to lists of meter readings.
+            combined (list[MeterReading] | ReadingSeries): The combined meter readings.
+            meters (dict): A dictionary mapping meter names to their readings, either as
+                lists of MeterReading or as ReadingSeries.
         """
-        self.meter: dict[str, list[MeterReading]] = meters
-        self.combined: list[MeterReading] = combined
+        self.meter: dict[str, ReadingSeries] = {name: as_series(readings)
+                                                for name, readings in meters.items()}
+        self.combined: ReadingSeries = as_series(combined)
 
-    def __getitem__(self, key) -> list[MeterReading]:
+    def __getitem__(self, key) -> ReadingSeries:
         """Retrieves the meter readings for the specified meter name.
 
         Args:
             key (str): The meter name.
 
         Returns:
-            list[MeterReading]: A list of meter readings for the specified meter.
+            The meter readings for the specified meter.
         """
         return self.meter[key]
 
@@ -156,7 +179,7 @@ class ReadingService:
         Returns:
             list[float]: A list of readings from the specified meter.
         """
-        return [r.kwh for r in self.meter[meter_name]]
+        return self.meter[meter_name].kwh.tolist()
 
     def get_tslist(self, meter_name: str) -> list[datetime]:
         """Extracts a timestamp-only list from the specified meter.
@@ -167,9 +190,10 @@ class ReadingService:
         Returns:
             list[datetime]: A list of timestamps from the specified meter.
         """
-        return [r.timestamp for r in self.meter[meter_name]]
+        # This is the API boundary where int64 timestamps become datetimes.
+        return [datetime.fromtimestamp(int(ts)) for ts in self.meter[meter_name].ts]
 
-    def get_combined(self) -> list[MeterReading]:
+    def get_combined(self) -> ReadingSeries:
         """Retrieves the combined list of meter readings.
 
         The combined list is always present, and should be the most complete source of valid timestamps.
@@ -177,7 +201,7 @@ class ReadingService:
         the types of meters being reported.
 
         Returns:
-            list[MeterReading]: The combined list of meter readings.
+            The combined list of meter readings.
         """
         return self.combined
 
@@ -187,18 +211,27 @@ class ReadingService:
         Args:
             fname (str): The name of the file to write the report to.
         """
+        combined = self.combined
+        target_ts = combined.ts + time_offset * 3600
+        # Align each meter against the combined timestamps up front: one searchsorted call
+        # per meter replaces the per-row linear scans of every meter list.
+        columns = []
+        for name in self.meter:
+            series = self.meter[name]
+            if len(series):
+                idx = np.searchsorted(series.ts, target_ts).clip(max=len(series.ts) - 1)
+                matched = series.ts[idx] == target_ts
+            else:
+                idx = np.zeros(len(combined), dtype=np.int64)
+                matched = np.zeros(len(combined), dtype=bool)
+            columns.append((series, idx, matched))
+
         with open(fname, 'w') as hndl:
-            for entry in self.combined:
-                dt = entry.timestamp.isoformat()
-                dtc = entry.timestamp + timedelta(hours=time_offset)
-                kwh_c = entry.kwh
-                kwh_m = []
-                for m in self.meter:
-                    mr = [me for me in m if me.timestamp == dtc]
-                    if mr:
-                        if len(mr) > 1: kwh_m.append([v.kwh for v in mr])
-                        else: kwh_m.append(mr[0].kwh)
-                    else: kwh_m.append("")
+            for i in range(len(combined)):
+                dtc = datetime.fromtimestamp(int(target_ts[i]))
+                kwh_c = float(combined.kwh[i])
+                kwh_m = [float(series.kwh[idx[i]]) if matched[i] else ""
+                         for series, idx, matched in columns]
                 print(f"{dtc.isoformat()}\t{kwh_c:.2f}\t{kwh_m}")
                 hndl.write(f"{dtc.isoformat()}\t{kwh_c:.2f}\t{kwh_m}\n")
 
@@ -219,10 +252,10 @@ class ReadingService:
         primary = self.meter[primary_meter]
         subtractive = self.meter[subtractive_meter]
 
-        subtractive_idx = 0
-        for reading in primary:
-            while subtractive_idx < len(subtractive) and subtractive[subtractive_idx].timestamp < reading.timestamp:
-                subtractive_idx += 1
-            if subtractive_idx == len(subtractive): return  # No further values to subtractive.
-            if subtractive[subtractive_idx].timestamp == reading.timestamp:
-                reading.kwh -= subtractive[subtractive_idx].kwh
+        if not len(subtractive): return
+        # Align the two sorted timestamp columns in one searchsorted call and subtract
+        # the matched rows in place, instead of walking both series in Python.
+        idx = np.searchsorted(subtractive.ts, primary.ts)
+        idx = idx.clip(max=len(subtractive.ts) - 1)
+        matched = subtractive.ts[idx] == primary.ts
+        primary.kwh[matched] -= subtractive.kwh[idx[matched]]
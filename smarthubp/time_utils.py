@@ -1,21 +1,139 @@
 import base64
+import binascii
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
 
 time_offset = 0
 
+# 256-entry decode table covering the standard base64 alphabet plus the smarthub altchars
+# ($ for +, _ for /).  Invalid characters map to 0xFF, so a single OR across the decoded
+# values detects them in one branch.
+_B64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+_DECODE_TABLE = bytearray(b"\xff" * 256)
+for _i, _c in enumerate(_B64_ALPHABET):
+    _DECODE_TABLE[_c] = _i
+_DECODE_TABLE[ord('$')] = 62
+_DECODE_TABLE[ord('_')] = 63
+_DECODE_TABLE = bytes(_DECODE_TABLE)
+
+# The same table as an ndarray, for fancy-indexed batch decodes.
+_DECODE_TABLE_NP = np.frombuffer(_DECODE_TABLE, dtype=np.uint8)
+
+# Largest epoch value a signed 64-bit time_t can hold.  Decodes beyond it — junk tokens
+# produce values hundreds of bits wide — are rejected with a cheap integer compare instead of
+# letting the huge int reach the C conversion, which raises the same OverflowError.  Values
+# below the threshold still go to datetime.fromtimestamp, so the ValueError/OSError types it
+# raises for merely out-of-range timestamps are unchanged.
+_MAX_TIME_T = 2 ** 63 - 1
+
+def _epoch_from_encoded(ts_str: str) -> int:
+    """ Decode a single uuencoded 4msec-from-epoch timestamp to epoch seconds.
+
+        The tokens smarthub emits are 7 characters (five payload bytes), so that width takes
+        a straight-line lookup-table decode with no loop.  Other widths fall back to a generic
+        table-driven loop which, like base64.b64decode without validation, discards characters
+        outside the alphabet — the raw csvd tokens arrive quoted ("TIMESTAMP") — and stops at
+        '=' padding once it completes a quad, as on encoded_from_timestamp output.  Impossible
+        data lengths raise binascii.Error, matching the base64 module's behavior.
+    """
+    byte_str = ts_str.encode()
+    table = _DECODE_TABLE
+    if len(byte_str) == 7:
+        v0 = table[byte_str[0]]; v1 = table[byte_str[1]]; v2 = table[byte_str[2]]
+        v3 = table[byte_str[3]]; v4 = table[byte_str[4]]; v5 = table[byte_str[5]]
+        v6 = table[byte_str[6]]
+        if (v0 | v1 | v2 | v3 | v4 | v5 | v6) < 0x40:
+            acc = (v0 << 36) | (v1 << 30) | (v2 << 24) | (v3 << 18) | (v4 << 12) | (v5 << 6) | v6
+            return (acc >> 2) // 250  # 42 bits accumulated; the payload is the top 40.
+        # A non-alphabet character; fall through and let the lenient loop discard it.
+
+    acc = 0
+    count = 0
+    pads = 0
+    for ch in byte_str:
+        if ch == 0x3D:  # '=' padding ends the data once it completes a quad, as in a2b_base64
+            pads += 1
+            if count % 4 >= 2 and count % 4 + pads >= 4:
+                break
+            continue
+        v = table[ch]
+        if v >= 0x40:
+            continue  # quotes and anything else b64decode would skip
+        acc = (acc << 6) | v
+        count += 1
+        pads = 0
+    # A base64 payload can never be one more than a multiple of 4 data characters.
+    if count % 4 == 1:
+        raise binascii.Error("Invalid base64-encoded string: wrong length.")
+    msec4epoch = acc >> ((count * 6) % 8)
+    return msec4epoch//250
+
+
+@lru_cache(maxsize=4096)
 def timestamp_from_encoded(ts_str: str) -> datetime:
     """ Convert from uuencode 4msec from epoch format to datetime.
 
+        Results are memoized: repeated tokens (common across overlapping datasets) resolve
+        with a dict probe instead of re-running the decode.  Failed decodes are not cached;
+        lru_cache lets their exceptions propagate.
+
         Args:
             ts_str (str): Encoded timestamp to decode.
 
         Returns:
             datetime: Timestamp in datetime format.
     """
-    byte_str = (ts_str + "==").encode()          # "Yf3U_WA" => b"YF3U_WA=="
-    byte_str = base64.b64decode(byte_str, altchars=b"$_")  # => b"a\xfd\xd4\xfd"
-    msec4epoch = int.from_bytes(byte_str, "big")
-    return datetime.fromtimestamp(msec4epoch//250)
+    seconds = _epoch_from_encoded(ts_str)
+    if seconds > _MAX_TIME_T:
+        raise OverflowError("timestamp out of range for platform time_t")
+    return datetime.fromtimestamp(seconds)
+
+
+def epochs_from_encoded(ts_tokens: list[str]) -> np.ndarray:
+    """ Decode a batch of encoded timestamps with one vectorized table lookup.
+
+        Timestamp tokens produced by smarthub are 7 payload characters (42 bits, of which the
+        top 40 are the 4msec-from-epoch value), and in the raw csvd data they arrive quoted
+        as 9-character tokens.  Either uniform width is mapped through the decode table with
+        one fancy-indexing pass — the quote columns are simply dropped — and the value columns
+        are combined with int64 broadcasts, so no Python-level work happens per token.
+        Anything else (mixed widths, stray characters the lenient decoder would discard) falls
+        back to the scalar decoder, which also raises for genuinely malformed tokens.
+
+        Args:
+            ts_tokens (list): Encoded timestamp tokens to decode.
+
+        Returns:
+            np.ndarray: The decoded timestamps as an int64 array of epoch seconds.
+    """
+    count = len(ts_tokens)
+    if not count:
+        return np.empty(0, dtype=np.int64)
+    width = len(ts_tokens[0])
+    if width not in (7, 9) or any(len(token) != width for token in ts_tokens):
+        return np.fromiter((_epoch_from_encoded(token) for token in ts_tokens),
+                           dtype=np.int64, count=count)
+    buf = np.frombuffer("".join(ts_tokens).encode(), dtype=np.uint8)
+    if buf.size != width * count:  # non-ascii characters encode to more than one byte
+        return np.fromiter((_epoch_from_encoded(token) for token in ts_tokens),
+                           dtype=np.int64, count=count)
+    vals = _DECODE_TABLE_NP[buf].reshape(-1, width)
+    if width == 9:
+        # Quoted tokens: the first and last columns must be non-alphabet (the quotes) and
+        # the middle seven the payload; anything else is irregular enough for the fallback.
+        if (vals[:, 0] < 0x40).any() or (vals[:, width - 1] < 0x40).any():
+            return np.fromiter((_epoch_from_encoded(token) for token in ts_tokens),
+                               dtype=np.int64, count=count)
+        vals = vals[:, 1:8]
+    if (vals >= 0x40).any():
+        return np.fromiter((_epoch_from_encoded(token) for token in ts_tokens),
+                           dtype=np.int64, count=count)
+    vals = vals.astype(np.int64)
+    acc = (vals[:, 0] << 36) | (vals[:, 1] << 30) | (vals[:, 2] << 24) | (vals[:, 3] << 18) \
+          | (vals[:, 4] << 12) | (vals[:, 5] << 6) | vals[:, 6]
+    return (acc >> 2) // 250  # 42 bits accumulated; the payload is the top 40.
 
 
 def encoded_from_timestamp(timestamp: datetime) -> str:
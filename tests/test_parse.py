@@ -16,19 +16,19 @@ class ExtractMetersCase(unittest.TestCase):
                      'starthere', '"xxxx+1"', '"metername1"', '"class.name"', '"other-name"']
         end_data = ['"column"', 'endhere']
         # Base 1 meter after + pattern.
-        meters = _extract_meters(test_data + end_data)
+        meters = _extract_meters(','.join(test_data + end_data))
         self.assertEqual(meters, ['metername1'])
 
         # Second meter and third meter no intervening + entry.
         test_data += ['xxxx+2', '"metername2"', '"#FFEE32"', '"some.class.second"', '"metername3"',
                       '"some.class.third"']
-        meters = _extract_meters(test_data + end_data)
+        meters = _extract_meters(','.join(test_data + end_data))
         self.assertEqual(meters, ['metername1', 'metername2', 'metername3'])
 
         # Third and sub-meters.
         test_data += ["'xxxx+3'", '"metername4"', '"#COLOR"', '"metername4 - sub1"',
                       '"some.class"', '"metername4 - sub2"', '"metername4 - sub3"']
-        meters = _extract_meters(test_data + end_data)
+        meters = _extract_meters(','.join(test_data + end_data))
         self.assertEqual(meters, ['metername1', 'metername2', 'metername3',
                                   'metername4 - sub1', 'metername4 - sub2',
                                   'metername4 - sub3'])
@@ -40,7 +40,7 @@ class ExtractMetersCase(unittest.TestCase):
         test_data = ['"1234+1"', '"metername1"', '"net-meter-column"', '"some.class"']
 
         with self.assertRaises(InvalidMetadata):
-            meters = _extract_meters(test_data)
+            meters = _extract_meters(','.join(test_data))
 
     def test_no_start_marker(self):
         """ The csv metadata must contain an entry with + in it to mark the start of the meters.
@@ -49,7 +49,7 @@ class ExtractMetersCase(unittest.TestCase):
         test_data = ['"metername1"', '"column"', '"some.class.stuff"']
 
         with self.assertRaises(InvalidMetadata):
-            meters = _extract_meters(test_data)
+            meters = _extract_meters(','.join(test_data))
 
 
 def _generate_entry(reading: float, timestamp: datetime):
@@ -1,4 +1,133 @@
+import os
+import tempfile
 import unittest
+from datetime import datetime
+from random import random
+
+from smarthubp import MeterReading, ReadingSeries
+from smarthubp.reading_service import ReadingService, readings_from_str, readings_from_utility_usage
+from smarthubp.time_utils import encoded_from_timestamp
+
+
+def _usage_point(timestamp: datetime, kwh: float) -> dict:
+    """ Build a utility-usage style data point from a timestamp and reading. """
+    return {"x": (int(timestamp.timestamp()) - 21600) * 1000, "y": kwh}
+
+
+def _service_payload(combined: list, meter: list) -> str:
+    """ Build a minimal //OK reading-service payload with one meter list and a combined list. """
+    csv = ['3']
+    for kwh, ts in meter:
+        csv += [str(kwh), '10', encoded_from_timestamp(ts), '9', '0', '0', '1', '0', '0', '8']
+    csv += [encoded_from_timestamp(meter[0][1]), encoded_from_timestamp(meter[-1][1]), '24']
+    csv += ['13', '12', '11']
+    for kwh, ts in combined:
+        csv += [str(kwh), '10', encoded_from_timestamp(ts), '9', '0', '0', '1', '0', '0', '8']
+    meta = '["xxxx+1","meter1","some.class","column","z"]'
+    return "//OK[" + ",".join(csv) + "," + meta + ",0,7]"
+
+
+class ReadingSeriesCase(unittest.TestCase):
+    def test_round_trip(self):
+        """ A series built from MeterReadings should present the same readings back. """
+        readings = [MeterReading(datetime(2023, 5, 1, h), random()) for h in range(0, 20)]
+
+        series = ReadingSeries.from_readings(readings)
+
+        self.assertEqual(len(series), len(readings))
+        for original, view in zip(readings, series):
+            self.assertEqual(view.timestamp, original.timestamp)
+            self.assertEqual(view.kwh, original.kwh)
+        self.assertEqual(series[3].timestamp, readings[3].timestamp)
+
+
+class UtilityUsageCase(unittest.TestCase):
+    def test_readings_from_utility_usage(self):
+        """ The utility-usage factory should expose the combined and per-meter series. """
+        test_data = [(datetime(2023, 5, 1, h), random()) for h in range(0, 20)]
+        jsd = {"data": {"ELECTRIC": [{
+            "baseSeries": {"data": [_usage_point(ts, kwh) for ts, kwh in test_data]},
+            "series": [{"name": "meter1", "data": [_usage_point(ts, kwh) for ts, kwh in test_data]}],
+        }]}}
+
+        service = readings_from_utility_usage(jsd)
+
+        self.assertEqual(list(service.meter_names), ["meter1"])
+        self.assertEqual(service.get_tslist("meter1"), [ts for ts, _ in test_data])
+        for kwh, expected in zip(service.get_rlist("meter1"), test_data):
+            self.assertAlmostEqual(kwh, expected[1])
+
+
+class ReportCase(unittest.TestCase):
+    def test_report_alignment(self):
+        """ Each report row should carry the combined reading plus the matching meter reading,
+            with a blank column where a meter has no reading for that timestamp. """
+        timestamps = [datetime(2023, 5, 1, h) for h in range(0, 4)]
+        combined = ReadingSeries.from_readings([MeterReading(ts, 5.0) for ts in timestamps])
+        partial = ReadingSeries.from_readings([MeterReading(ts, 2.0) for ts in timestamps[::2]])
+        service = ReadingService(combined, {"partial": partial})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "report.txt")
+            service.report(fname)
+            with open(fname) as hndl:
+                lines = hndl.read().splitlines()
+
+        self.assertEqual(len(lines), len(timestamps))
+        for i, (line, ts) in enumerate(zip(lines, timestamps)):
+            expected_m = [2.0] if i % 2 == 0 else ['']
+            self.assertEqual(line, f"{ts.isoformat()}\t5.00\t{expected_m}")
+
+    def test_report_reading_service_payload(self):
+        """ Meter lists parsed from a reading-service payload run opposite the combined list;
+            the alignment must still hold, so a meter with a reading at every combined
+            timestamp should leave no blank cells. """
+        timestamps = [datetime(2023, 5, 1, h) for h in range(0, 6)]
+        payload = _service_payload(combined=[(5.0, ts) for ts in timestamps],
+                                   meter=[(2.0, ts) for ts in timestamps])
+
+        with self.assertLogs(level='WARNING'):
+            service = readings_from_str(payload)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "report.txt")
+            service.report(fname)
+            with open(fname) as hndl:
+                lines = hndl.read().splitlines()
+
+        self.assertEqual(len(lines), len(timestamps))
+        for line, ts in zip(lines, timestamps):
+            self.assertEqual(line, f"{ts.isoformat()}\t5.00\t[2.0]")
+
+
+class ApplySubtractiveMeterCase(unittest.TestCase):
+    def test_apply_subtractive_series(self):
+        """ Aligned timestamps should have the subtractive meter's kwh removed in place;
+            timestamps present only on the primary should be untouched. """
+        timestamps = [datetime(2023, 5, 1, h) for h in range(0, 20)]
+        primary = ReadingSeries.from_readings([MeterReading(ts, 5.0) for ts in timestamps])
+        subtractive = ReadingSeries.from_readings([MeterReading(ts, 2.0) for ts in timestamps[::2]])
+        service = ReadingService(primary, {"primary": primary, "sub": subtractive})
+
+        service.apply_subtractive_meter("primary", "sub")
+
+        for i, reading in enumerate(service["primary"]):
+            expected = 3.0 if i % 2 == 0 else 5.0
+            self.assertEqual(reading.kwh, expected, f"{i=}")
+
+    def test_apply_subtractive_lists(self):
+        """ List-provided readings are coerced to series storage; the subtraction should be
+            visible through the service. """
+        timestamps = [datetime(2023, 5, 1, h) for h in range(0, 20)]
+        primary = [MeterReading(ts, 5.0) for ts in timestamps]
+        subtractive = [MeterReading(ts, 2.0) for ts in timestamps[::2]]
+        service = ReadingService(primary, {"primary": primary, "sub": subtractive})
+
+        service.apply_subtractive_meter("primary", "sub")
+
+        for i, reading in enumerate(service["primary"]):
+            expected = 3.0 if i % 2 == 0 else 5.0
+            self.assertEqual(reading.kwh, expected, f"{i=}")
+
 
 if __name__ == '__main__':
     unittest.main()
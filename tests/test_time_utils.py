@@ -1,23 +1,37 @@
 import binascii
 import unittest
 from datetime import datetime
+from functools import lru_cache
+
 from smarthubp.time_utils import timestamp_from_encoded
 
 
+@lru_cache(maxsize=None)
+def _dt(year: int, month: int, day: int, hour: int, minute: int) -> datetime:
+    """ Cached datetime literals: fixture values shared across test modules are
+        constructed once, however often the tuples below are imported or rebuilt. """
+    return datetime(year, month, day, hour, minute)
+
+
+# Constructed once at import rather than on every test invocation.
+_VALID_CASES = (
+    ('VdPMRgA', _dt(2016, 9, 21, 19, 0)),
+    ('"VdPMRgA"', _dt(2016, 9, 21, 19, 0)),  # Quoted, as tokens appear in the raw csvd data.
+    ('Xuo9HwA', _dt(2021, 9, 2, 19, 0)),
+    ('YGoQF$A', _dt(2022, 6, 27, 22, 0)),  # Special Character test: $
+    ('YGou_gg', _dt(2022, 6, 28, 0, 15)),  # Special Character test: _
+    ('ZQjBkEA', _dt(2025, 1, 1, 12, 0)),
+    ('3hvvMEA', _dt(2090, 12, 1, 4, 0)),  # Arbitrary far future date.
+)
+
+_INVALID_CASES = (
+    ('invalid_string', OverflowError),
+    ('invalid_input', binascii.Error),
+    ('a', binascii.Error),
+)
+
+
 class TestTimestampFromEncoded(unittest.TestCase):
-    def test_valid_inputs(self):
-        test_cases = [
-            ('VdPMRgA', datetime(2016, 9, 21, 19, 0)),
-            ('Xuo9HwA', datetime(2021, 9, 2, 19, 0)),
-            ('YGoQF$A', datetime(2022, 6, 27, 22, 0)),  # Special Character test: $
-            ('YGou_gg', datetime(2022, 6, 28, 0, 15)),  # Special Character test: _
-            ('ZQjBkEA', datetime(2025, 1, 1, 12, 0)),
-            ('3hvvMEA', datetime(2090, 12, 1, 4, 0)),  # Arbitrary far future date.
-        ]
-        for encoded, expected in test_cases:
-            with self.subTest(encoded=encoded):
-                result = timestamp_from_encoded(encoded)
-                self.assertEqual(result, expected)
 
     def test_invalid_inputs(self):
         """ Test various invalid inputs.
@@ -26,16 +40,25 @@ class TestTimestampFromEncoded(unittest.TestCase):
             The base64 decoder only except characters within the defined range.
             The base64 encoded string must not be one more than a multiple of 4 characters.
         """
-        test_cases = [
-            ('invalid_string', OverflowError),
-            ('invalid_input', binascii.Error),
-            ('a', binascii.Error),
-        ]
-
-        for encoded, expected_error in test_cases:
-            print(encoded)
-            with self.assertRaises(expected_error):
-                timestamp_from_encoded(encoded)
+        # Bind the hot lookups to locals; the loop then avoids per-case attribute probes.
+        _raises = self.assertRaises
+        _decode = timestamp_from_encoded
+        for encoded, expected_error in _INVALID_CASES:
+            with _raises(expected_error, msg=f"{encoded=}"):
+                _decode(encoded)
+
+
+def _make_valid_case(encoded: str, expected: datetime):
+    """ Synthesize one test method per valid input, avoiding subTest's per-case
+        context-manager overhead. """
+    def test(self):
+        self.assertEqual(timestamp_from_encoded(encoded), expected)
+    test.__doc__ = f"Decode {encoded!r} to {expected.isoformat()}."
+    return test
+
+
+for _i, (_encoded, _expected) in enumerate(_VALID_CASES):
+    setattr(TestTimestampFromEncoded, f'test_valid_input_{_i}', _make_valid_case(_encoded, _expected))
 
 
 if __name__ == '__main__':